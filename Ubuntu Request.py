@@ -1,62 +1,340 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import os
+import queue
+import functools
 import hashlib
+import json
 import mimetypes
+import mmap
 from urllib.parse import urlparse
 from pathlib import Path
+import sys
+import shutil
 import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+class HashingReader:
+    """File-like wrapper that hashes and counts bytes as they are read"""
+    
+    def __init__(self, raw, hasher, max_size=None):
+        self.raw = raw
+        self.hasher = hasher
+        self.max_size = max_size
+        self.size = 0
+        self.too_large = False
+    
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.hasher.update(data)
+        self.size += len(data)
+        # Stop the copy early once the size limit is exceeded
+        if self.max_size is not None and self.size > self.max_size:
+            self.too_large = True
+            return b''
+        return data
+    
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+@functools.lru_cache(maxsize=256)
+def _parse_url(url):
+    """Parse a URL, caching results for batches that repeat URLs"""
+    return urlparse(url)
+
+@functools.lru_cache(maxsize=64)
+def _extension_for(content_type):
+    """Guess a file extension for a MIME type, defaulting to .jpg"""
+    return mimetypes.guess_extension(content_type) or '.jpg'
+
+class _SafeFilenameTable(dict):
+    """str.translate table that keeps alphanumerics and '.-_' only.
+    
+    Entries are computed on first use, so non-ASCII code points keep the
+    same str.isalnum() rules without building a table for all of Unicode.
+    """
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in '.-_' else None
+        self[codepoint] = value
+        return value
 
 class UbuntuImageFetcher:
+    # Maximum file size accepted while streaming (bytes)
+    MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+    
+    # Read size for streamed downloads. Large chunks keep the Python loop
+    # overhead per megabyte low; small responses use a smaller chunk so the
+    # first bytes are handed over without waiting on a big read.
+    CHUNK_SIZE = 1 << 19  # 512KB
+    SMALL_CHUNK_SIZE = 1 << 15  # 32KB
+    SMALL_FILE_SIZE = 64 * 1024  # 64KB
+    
+    # Batch download concurrency, per-host download limit and per-host
+    # politeness delay (seconds)
+    MAX_WORKERS = 8
+    MAX_PER_HOST = 2
+    REQUEST_DELAY = 1
+    
+    # URL schemes accepted by _validate_url
+    _SCHEMES = ('http://', 'https://')
+    
+    # Translation table used to sanitize filenames
+    _FILENAME_TABLE = _SafeFilenameTable()
+    
+    # Bytes read before a file is created; smaller images are checked for
+    # duplicates without touching the disk
+    PREFIX_SIZE = 64 * 1024  # 64KB
+    
+    # Sidecar file caching {filename: {mt, sz, h, u, e, lm}} for
+    # existing images; u/e/lm are the source URL, ETag and Last-Modified
+    INDEX_FILENAME = ".hash_index.json"
+    
     def __init__(self):
         self.base_dir = "Fetched_Images"
         self.downloaded_hashes = set()
+        # Load the MIME tables up front rather than on the first lookup
+        mimetypes.init()
         self.session = requests.Session()
         # Set a respectful User-Agent header
         self.session.headers.update({
-            'User-Agent': 'Ubuntu-Image-Fetcher/1.0 (Respectful Community Tool)'
+            'User-Agent': 'Ubuntu-Image-Fetcher/1.0 (Respectful Community Tool)',
+            # Offer every encoding urllib3 can decode (br needs brotli)
+            'Accept-Encoding': ACCEPT_ENCODING,
         })
+        # Keep enough pooled connections for concurrent batch downloads and
+        # retry transient gateway errors with a short backoff
+        retries = Retry(total=3, backoff_factor=0.5,
+                        status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                              max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._hash_index = {}
+        # URL -> index record, for conditional re-downloads
+        self._url_records = {}
+        # Guards the duplicate check-and-add on downloaded_hashes
+        self._hashes_lock = threading.Lock()
+        # Names in base_dir, scanned on first download and kept up to date
+        self._existing_names = None
+        self._names_lock = threading.Lock()
         self._load_existing_hashes()
+        # Index updates from download workers, applied by a writer thread
+        self._index_queue = queue.Queue()
+        self._index_writer = threading.Thread(target=self._write_index_updates,
+                                              daemon=True)
+        self._index_writer.start()
+    
+    def close(self):
+        """Flush pending index updates and stop the index writer"""
+        if self._index_writer.is_alive():
+            self._index_queue.put(None)
+            self._index_writer.join()
     
     def _load_existing_hashes(self):
-        """Load hashes of existing images to prevent duplicates"""
-        if os.path.exists(self.base_dir):
-            for filename in os.listdir(self.base_dir):
-                filepath = os.path.join(self.base_dir, filename)
-                if os.path.isfile(filepath):
-                    try:
-                        with open(filepath, 'rb') as f:
-                            file_hash = hashlib.md5(f.read()).hexdigest()
-                            self.downloaded_hashes.add(file_hash)
-                    except Exception:
-                        continue
+        """Load hashes of existing images to prevent duplicates.
+        
+        Hashes are cached in a sidecar index keyed by filename; only files
+        whose mtime or size changed since the last run are rehashed.
+        """
+        if not os.path.exists(self.base_dir):
+            return
+        
+        cached = self._read_hash_index()
+        index = {}
+        index_filenames = self._index_filenames()
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.name in index_filenames:
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                    record = cached.get(entry.name)
+                    if (not self._is_valid_record(record)
+                            or record['mt'] != stat.st_mtime_ns
+                            or record['sz'] != stat.st_size):
+                        record = {
+                            'mt': stat.st_mtime_ns,
+                            'sz': stat.st_size,
+                            'h': self._hash_file(entry.path),
+                        }
+                    elif 'p' in record:
+                        # Drop the prefix hash older indexes stored
+                        record = {key: value for key, value in record.items()
+                                  if key != 'p'}
+                    index[entry.name] = record
+                except Exception:
+                    continue
+        
+        self._hash_index = index
+        for record in index.values():
+            self.downloaded_hashes.add(record['h'])
+            if record.get('u'):
+                self._url_records[record['u']] = record
+        if index != cached:
+            self._save_hash_index()
+    
+    def _is_valid_record(self, record):
+        """Check that a cached index record has the fields we rely on"""
+        if not isinstance(record, dict):
+            return False
+        if not all(isinstance(record.get(key), int) for key in ('mt', 'sz')):
+            return False
+        if not isinstance(record.get('h'), str):
+            return False
+        # Optional fields must be strings too; they end up in sets, dict
+        # keys and request headers
+        return all(isinstance(record[key], str)
+                   for key in ('u', 'e', 'lm') if key in record)
+    
+    def _read_hash_index(self):
+        """Read the sidecar hash index, ignoring a missing or corrupt file"""
+        try:
+            with open(os.path.join(self.base_dir, self.INDEX_FILENAME)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+    
+    def _save_hash_index(self):
+        """Atomically write the sidecar hash index"""
+        index_name, tmp_name = self._index_filenames()
+        index_path = os.path.join(self.base_dir, index_name)
+        tmp_path = os.path.join(self.base_dir, tmp_name)
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._hash_index, f)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            # The index is only a cache; the next run will rebuild it
+            pass
+    
+    def _index_filenames(self):
+        """Names used in base_dir by the sidecar index and its temp file"""
+        return self.INDEX_FILENAME, f"{self.INDEX_FILENAME}.tmp"
+    
+    def _write_index_updates(self):
+        """Apply queued index updates, writing the index once per batch.
+        
+        Runs on its own thread so download workers only ever put() onto
+        the queue. Everything already queued is applied before each write,
+        so bursts of downloads share a single rewrite of the index. A None
+        item stops the writer.
+        """
+        while True:
+            item = self._index_queue.get()
+            stopping = item is None
+            while item is not None:
+                filename, record = item
+                self._hash_index[filename] = record
+                try:
+                    item = self._index_queue.get_nowait()
+                except queue.Empty:
+                    break
+                stopping = item is None
+            self._save_hash_index()
+            if stopping:
+                return
+    
+    def _record_saved_file(self, filepath, content_hash, url, response):
+        """Add a freshly saved image to the hash index"""
+        stat = os.stat(filepath)
+        record = {
+            'mt': stat.st_mtime_ns,
+            'sz': stat.st_size,
+            'h': content_hash,
+            'u': url,
+        }
+        # Keep validators so the next fetch of this URL can be conditional
+        if 'etag' in response.headers:
+            record['e'] = response.headers['etag']
+        if 'last-modified' in response.headers:
+            record['lm'] = response.headers['last-modified']
+        self._url_records[url] = record
+        self._index_queue.put((os.path.basename(filepath), record))
+    
+    def _conditional_headers(self, url):
+        """Build If-None-Match/If-Modified-Since headers for a known URL"""
+        record = self._url_records.get(url)
+        headers = {}
+        if record:
+            if record.get('e'):
+                headers['If-None-Match'] = record['e']
+            if record.get('lm'):
+                headers['If-Modified-Since'] = record['lm']
+        return headers
+    
+    def _new_hasher(self):
+        """Create the hash object used for duplicate detection.
+        
+        Hashes are only compared locally, so a fast 128-bit BLAKE2b digest
+        is used instead of MD5.
+        """
+        return hashlib.blake2b(digest_size=16)
+    
+    def _read_prefix(self, reader):
+        """Read up to PREFIX_SIZE bytes, stopping early only at end of stream"""
+        prefix = bytearray()
+        while len(prefix) < self.PREFIX_SIZE:
+            data = reader.read(self.PREFIX_SIZE - len(prefix))
+            if not data:
+                break
+            prefix.extend(data)
+        return prefix
+    
+    def _hash_file(self, filepath):
+        """Hash a file on disk without reading it into memory at once"""
+        with open(filepath, 'rb') as f:
+            # Map the file and hash it straight from the page cache
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    file_hash = self._new_hasher()
+                    file_hash.update(mm)
+                    return file_hash.hexdigest()
+            except (ValueError, OSError):
+                # Empty files and unmappable files fall back to reading
+                pass
+            
+            if sys.version_info >= (3, 11):
+                return hashlib.file_digest(f, self._new_hasher).hexdigest()
+            file_hash = self._new_hasher()
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                file_hash.update(chunk)
+            return file_hash.hexdigest()
     
     def _validate_url(self, url):
         """Basic URL validation"""
-        if not url.startswith(('http://', 'https://')):
-            return False, "URL must start with http:// or https://"
+        if not url.startswith(self._SCHEMES):
+            return False, "URL must start with http:// or https://", None
         
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         if not parsed.netloc:
-            return False, "Invalid URL format"
+            return False, "Invalid URL format", None
         
-        return True, "Valid URL"
+        return True, "Valid URL", parsed
     
-    def _check_security_headers(self, response):
+    def _check_security_headers(self, response, content_type):
         """Check important HTTP headers for security considerations"""
         headers = response.headers
         warnings = []
         
         # Check Content-Type
-        content_type = headers.get('content-type', '').lower()
         if not content_type.startswith('image/'):
             warnings.append(f"⚠ Content-Type is '{content_type}', not an image type")
         
         # Check Content-Length for reasonable file size (max 50MB)
         content_length = headers.get('content-length')
         if content_length:
-            size_mb = int(content_length) / (1024 * 1024)
-            if size_mb > 50:
-                warnings.append(f"⚠ Large file size: {size_mb:.1f}MB")
+            size = int(content_length)
+            if size > self.MAX_FILE_SIZE:
+                warnings.append(f"⚠ Large file size: {size / (1024 * 1024):.1f}MB")
         
         # Check for suspicious headers
         if 'content-disposition' in headers:
@@ -66,17 +344,14 @@ class UbuntuImageFetcher:
         
         return warnings
     
-    def _get_safe_filename(self, url, content_type):
-        """Generate a safe filename from URL and content type"""
-        parsed_url = urlparse(url)
+    def _get_safe_filename(self, parsed_url, content_type):
+        """Generate a safe filename from a parsed URL and content type"""
         filename = os.path.basename(parsed_url.path)
         
         # If no filename in URL, generate one
         if not filename or '.' not in filename:
             # Try to get extension from content-type
-            extension = mimetypes.guess_extension(content_type.split(';')[0])
-            if not extension:
-                extension = '.jpg'  # Default fallback
+            extension = _extension_for(content_type.split(';')[0])
             
             # Use domain name + timestamp for filename
             domain = parsed_url.netloc.replace('www.', '')
@@ -84,100 +359,196 @@ class UbuntuImageFetcher:
             filename = f"{domain}_{timestamp}{extension}"
         
         # Sanitize filename
-        filename = "".join(c for c in filename if c.isalnum() or c in '.-_')
+        filename = filename.translate(self._FILENAME_TABLE)
         return filename
     
-    def _is_duplicate(self, content):
-        """Check if image content is a duplicate"""
-        content_hash = hashlib.md5(content).hexdigest()
-        if content_hash in self.downloaded_hashes:
-            return True
-        self.downloaded_hashes.add(content_hash)
-        return False
+    def _reserve_filepath(self, filename):
+        """Pick a non-conflicting path for filename and reserve it.
+        
+        The directory is scanned once and its names kept in memory, so
+        conflict checks don't cost a stat call per candidate.
+        """
+        name, ext = os.path.splitext(filename)
+        with self._names_lock:
+            if self._existing_names is None:
+                with os.scandir(self.base_dir) as entries:
+                    self._existing_names = {entry.name for entry in entries}
+                # Never let an image take the sidecar index's names
+                self._existing_names.update(self._index_filenames())
+            candidate = filename
+            counter = 1
+            while candidate in self._existing_names:
+                candidate = f"{name}_{counter}{ext}"
+                counter += 1
+            self._existing_names.add(candidate)
+        return os.path.join(self.base_dir, candidate)
+    
+    def _open_new_file(self, filename):
+        """Create and open a new file for filename, never overwriting.
+        
+        The cached listing can miss files created by other programs, so
+        the file is opened exclusively and the next name is tried if one
+        turns up on disk.
+        """
+        while True:
+            filepath = self._reserve_filepath(filename)
+            try:
+                return open(filepath, 'xb'), filepath
+            except FileExistsError:
+                # Keep the name reserved; it really is taken now
+                continue
     
-    def fetch_image(self, url):
-        """Fetch a single image with comprehensive error handling"""
-        print(f"\n🔍 Processing: {url}")
+    def _release_filepath(self, filepath):
+        """Free a reserved path whose download was not kept"""
+        with self._names_lock:
+            self._existing_names.discard(os.path.basename(filepath))
+    
+    def _advise(self, f, advice):
+        """Pass a posix_fadvise hint for f where the platform supports it"""
+        if hasattr(os, 'posix_fadvise') and hasattr(os, advice):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+            except OSError:
+                pass
+    
+    def _get_chunk_size(self, response):
+        """Pick a streaming chunk size based on the advertised Content-Length"""
+        content_length = response.headers.get('content-length')
+        if content_length and content_length.isdigit():
+            if int(content_length) < self.SMALL_FILE_SIZE:
+                return self.SMALL_CHUNK_SIZE
+        return self.CHUNK_SIZE
+    
+    def fetch_image(self, url, log=print):
+        """Fetch a single image with comprehensive error handling.
+        
+        Progress and error messages go through log, which batch downloads
+        use to keep each URL's output together.
+        """
+        log(f"\n🔍 Processing: {url}")
         
         # Validate URL
-        is_valid, message = self._validate_url(url)
+        is_valid, message, parsed_url = self._validate_url(url)
         if not is_valid:
-            print(f"✗ Invalid URL: {message}")
+            log(f"✗ Invalid URL: {message}")
             return False
         
         try:
             # Make request with timeout and stream for large files
-            print("📡 Connecting...")
-            response = self.session.get(url, timeout=30, stream=True)
+            log("📡 Connecting...")
+            response = self.session.get(url, timeout=30, stream=True,
+                                        headers=self._conditional_headers(url))
             response.raise_for_status()
             
-            # Check security headers
-            warnings = self._check_security_headers(response)
-            for warning in warnings:
-                print(warning)
+            # The copy saved from this URL last time is still current
+            if response.status_code == 304:
+                response.close()
+                log("✗ Image unchanged since last download - skipping")
+                return False
             
             # Get content type
             content_type = response.headers.get('content-type', '').lower()
             
+            # Check security headers
+            warnings = self._check_security_headers(response, content_type)
+            for warning in warnings:
+                log(warning)
+            
             # Verify it's actually an image
             if not content_type.startswith('image/'):
-                print(f"✗ Not an image file (Content-Type: {content_type})")
-                return False
-            
-            # Download content
-            print("⬇ Downloading content...")
-            content = response.content
-            
-            # Check for duplicates
-            if self._is_duplicate(content):
-                print("✗ Duplicate image detected - skipping")
+                log(f"✗ Not an image file (Content-Type: {content_type})")
                 return False
             
             # Create directory if needed
             os.makedirs(self.base_dir, exist_ok=True)
             
             # Generate safe filename
-            filename = self._get_safe_filename(url, content_type)
-            filepath = os.path.join(self.base_dir, filename)
+            filename = self._get_safe_filename(parsed_url, content_type)
             
-            # Handle filename conflicts
-            counter = 1
-            original_filepath = filepath
-            while os.path.exists(filepath):
-                name, ext = os.path.splitext(original_filepath)
-                filepath = f"{name}_{counter}{ext}"
-                counter += 1
+            # Stream straight from the socket into the file, hashing as we go
+            log("⬇ Downloading content...")
+            response.raw.decode_content = True
+            reader = HashingReader(response.raw, self._new_hasher(),
+                                   self.MAX_FILE_SIZE)
+            filepath = None
+            saved = False
+            try:
+                # Small images end within the prefix, so their full hash is
+                # known before anything is written
+                prefix = self._read_prefix(reader)
+                if len(prefix) < self.PREFIX_SIZE:
+                    content_hash = reader.hexdigest()
+                    with self._hashes_lock:
+                        is_duplicate = content_hash in self.downloaded_hashes
+                    if is_duplicate:
+                        log("✗ Duplicate image detected - skipping")
+                        return False
+                
+                # Handle filename conflicts
+                f, filepath = self._open_new_file(filename)
+                with f:
+                    self._advise(f, 'POSIX_FADV_SEQUENTIAL')
+                    f.write(prefix)
+                    shutil.copyfileobj(reader, f, self._get_chunk_size(response))
+                    # Saved images are rarely read back; keep them out of the
+                    # page cache
+                    f.flush()
+                    self._advise(f, 'POSIX_FADV_DONTNEED')
+                
+                if reader.too_large:
+                    log("✗ File too large - aborting download")
+                    return False
+                
+                # Check for duplicates
+                content_hash = reader.hexdigest()
+                with self._hashes_lock:
+                    is_duplicate = content_hash in self.downloaded_hashes
+                    self.downloaded_hashes.add(content_hash)
+                if is_duplicate:
+                    log("✗ Duplicate image detected - skipping")
+                    return False
+                saved = True
+            finally:
+                response.close()
+                # Don't leave partial or duplicate files behind
+                if not saved and filepath:
+                    if os.path.exists(filepath):
+                        os.remove(filepath)
+                    self._release_filepath(filepath)
             
-            # Save the image
-            with open(filepath, 'wb') as f:
-                f.write(content)
+            self._record_saved_file(filepath, content_hash, url, response)
             
             # Get file size for display
-            file_size = len(content) / 1024  # KB
+            file_size = reader.size / 1024  # KB
             
-            print(f"✓ Successfully fetched: {os.path.basename(filepath)}")
-            print(f"✓ Image saved to {filepath}")
-            print(f"✓ File size: {file_size:.1f} KB")
+            log(f"✓ Successfully fetched: {os.path.basename(filepath)}")
+            log(f"✓ Image saved to {filepath}")
+            log(f"✓ File size: {file_size:.1f} KB")
             
             return True
             
         except requests.exceptions.Timeout:
-            print("✗ Connection timeout - server took too long to respond")
+            log("✗ Connection timeout - server took too long to respond")
         except requests.exceptions.ConnectionError:
-            print("✗ Connection error - unable to reach server")
+            log("✗ Connection error - unable to reach server")
         except requests.exceptions.HTTPError as e:
-            print(f"✗ HTTP error: {e}")
+            log(f"✗ HTTP error: {e}")
         except requests.exceptions.RequestException as e:
-            print(f"✗ Request error: {e}")
+            log(f"✗ Request error: {e}")
         except PermissionError:
-            print("✗ Permission denied - cannot write to directory")
+            log("✗ Permission denied - cannot write to directory")
         except OSError as e:
-            print(f"✗ File system error: {e}")
+            log(f"✗ File system error: {e}")
         except Exception as e:
-            print(f"✗ Unexpected error: {e}")
+            log(f"✗ Unexpected error: {e}")
         
         return False
     
+    def _fetch_for_batch(self, url):
+        """Fetch an image, returning the result and the messages it logged"""
+        lines = []
+        return self.fetch_image(url, log=lines.append), lines
+    
     def fetch_multiple_images(self, urls):
         """Fetch multiple images with progress tracking"""
         if not urls:
@@ -190,17 +561,63 @@ class UbuntuImageFetcher:
         successful = 0
         failed = 0
         
-        for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing image...")
-            
-            if self.fetch_image(url.strip()):
-                successful += 1
-            else:
-                failed += 1
-            
-            # Be respectful - small delay between requests
-            if i < len(urls):
-                time.sleep(1)
+        # Queue URLs per host. At most MAX_PER_HOST downloads per host are
+        # in flight, spaced REQUEST_DELAY apart, and the next URL for a
+        # host is only submitted once one of its downloads finishes, so
+        # pool threads never sit waiting on a busy host. No more than
+        # MAX_WORKERS jobs are submitted at once, so a job never queues
+        # inside the executor and its delay is counted from its real start.
+        pending = {}
+        for url in urls:
+            url = url.strip()
+            pending.setdefault(_parse_url(url).netloc, deque()).append(url)
+        in_flight = dict.fromkeys(pending, 0)
+        next_allowed = {}
+        futures = {}
+        completed = 0
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            while pending or futures:
+                now = time.monotonic()
+                next_wake = None
+                for host in list(pending):
+                    queued = pending[host]
+                    while (queued and in_flight[host] < self.MAX_PER_HOST
+                           and len(futures) < self.MAX_WORKERS):
+                        allowed = next_allowed.get(host, now)
+                        if allowed > now:
+                            if next_wake is None or allowed < next_wake:
+                                next_wake = allowed
+                            break
+                        url = queued.popleft()
+                        future = executor.submit(self._fetch_for_batch, url)
+                        futures[future] = (host, url)
+                        in_flight[host] += 1
+                        next_allowed[host] = now + self.REQUEST_DELAY
+                    if not queued:
+                        del pending[host]
+                
+                timeout = None if next_wake is None else max(0, next_wake - now)
+                if not futures:
+                    # Every host with work left is waiting out its delay
+                    time.sleep(timeout)
+                    continue
+                
+                done, _ = wait(futures, timeout=timeout,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    host, url = futures.pop(future)
+                    in_flight[host] -= 1
+                    ok, lines = future.result()
+                    completed += 1
+                    print(f"\n[{completed}/{len(urls)}] {url}")
+                    for line in lines:
+                        print(line)
+                    
+                    if ok:
+                        successful += 1
+                    else:
+                        failed += 1
         
         # Summary
         print("\n" + "=" * 50)
@@ -231,7 +648,6 @@ def main():
         if choice == '1':
             url = input("\nPlease enter the image URL: ").strip()
             if url:
-                fetcher.fetch_image(url)
                 if fetcher.fetch_image(url):
                     print("\nConnection strengthened. Community enriched.")
         
@@ -250,6 +666,7 @@ def main():
                 print("No URLs entered.")
         
         elif choice == '3':
+            fetcher.close()
             print("\nThank you for using Ubuntu Image Fetcher!")
             print("May your downloads be swift and your community strong. 🐧")
             break